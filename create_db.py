@@ -1,9 +1,48 @@
+from sqlalchemy import text
 from database import Base, engine
 # It's crucial to import the models here, even though the linter
 # might say 'models' is an unused import. This step is what registers
 # your tables with SQLAlchemy's metadata.
 import models
 
+# create_all only creates missing tables, so constraints added to existing
+# tables need their own idempotent step here.
+ADD_SAVED_RECIPES_UNIQUE_CONSTRAINT = [
+    # Point meal plan entries at the oldest copy of any duplicated saved recipe...
+    """
+    UPDATE meal_plan
+    SET saved_recipe_id = keep.id
+    FROM saved_recipes dup
+    JOIN (
+        SELECT user_id, api_recipe_id, MIN(id) AS id
+        FROM saved_recipes
+        GROUP BY user_id, api_recipe_id
+    ) keep ON keep.user_id = dup.user_id AND keep.api_recipe_id = dup.api_recipe_id
+    WHERE meal_plan.saved_recipe_id = dup.id AND dup.id <> keep.id
+    """,
+    # ...then drop the newer copies...
+    """
+    DELETE FROM saved_recipes dup
+    USING saved_recipes keep
+    WHERE dup.user_id = keep.user_id
+      AND dup.api_recipe_id = keep.api_recipe_id
+      AND dup.id > keep.id
+    """,
+    # ...so the constraint can be added if it isn't there yet.
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'uq_saved_recipes_user_api_recipe'
+        ) THEN
+            ALTER TABLE saved_recipes
+            ADD CONSTRAINT uq_saved_recipes_user_api_recipe UNIQUE (user_id, api_recipe_id);
+        END IF;
+    END
+    $$
+    """,
+]
+
 print("Creating database tables...")
 
 # Create all tables
@@ -11,3 +50,10 @@ Base.metadata.create_all(bind=engine)
 
 print("Database tables created successfully.")
 
+print("Applying saved recipe uniqueness constraint...")
+
+with engine.begin() as connection:
+    for statement in ADD_SAVED_RECIPES_UNIQUE_CONSTRAINT:
+        connection.execute(text(statement))
+
+print("Saved recipe uniqueness constraint applied.")
@@ -1,6 +1,6 @@
 from typing import List
 import uuid
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from database import Base
@@ -39,6 +39,7 @@ class User(Base):
     
 class SavedRecipe(Base):
     __tablename__ = "saved_recipes"
+    __table_args__ = (UniqueConstraint("user_id", "api_recipe_id", name="uq_saved_recipes_user_api_recipe"),)
 
     # Attributes
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional, Set
+import uuid
 import httpx
+from sqlalchemy.dialects.postgresql import insert
 from database import get_db
 import schemas
 import models
@@ -11,7 +15,71 @@ router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
 # Define the base URL for TheMealDB API
 THEMEALDB_API_URL = "https://www.themealdb.com/api/json/v1/1/search.php"
+THEMEALDB_LOOKUP_URL = "https://www.themealdb.com/api/json/v1/1/lookup.php"
 MAX_INGREDIENTS_PER_MEAL = 20
+MAX_CONCURRENT_LOOKUPS = 5
+
+def parse_meal(meal: dict) -> schemas.SavedRecipeBase:
+    """
+    Normalizes a raw TheMealDB meal into our recipe shape,
+    collapsing the numbered strIngredientN/strMeasureN fields into a list.
+    """
+    ingredients = []
+    for i in range(1, MAX_INGREDIENTS_PER_MEAL + 1):
+        ingredient_name: str = meal.get(f"strIngredient{i}")
+        ingredient_measure: str = meal.get(f"strMeasure{i}")
+        if ingredient_name and ingredient_name.strip():
+            ingredients.append(schemas.Ingredient(ingredient=ingredient_name, measure=ingredient_measure or ""))
+
+    return schemas.SavedRecipeBase(
+        api_recipe_id=meal['idMeal'],
+        image_url=meal['strMealThumb'],
+        ingredients=ingredients,
+        instructions=meal['strInstructions'],
+        title=meal['strMeal']
+    )
+
+async def lookup_meal(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, api_recipe_id: str) -> Optional[dict]:
+    """
+    Fetches a single meal by id from TheMealDB, waiting on the semaphore
+    so we never have more than MAX_CONCURRENT_LOOKUPS requests in flight.
+    Returns None if TheMealDB doesn't know the id.
+    Raises ValueError if the response body isn't JSON.
+    """
+    async with semaphore:
+        response = await client.get(THEMEALDB_LOOKUP_URL, params={"i": api_recipe_id})
+        response.raise_for_status()
+
+    data = response.json()
+    meals = data.get("meals") if isinstance(data, dict) else None
+    return meals[0] if isinstance(meals, list) and meals else None
+
+def get_saved_api_recipe_ids(db: Session, user_id: uuid.UUID, api_recipe_ids: List[str]) -> Set[str]:
+    """
+    Returns which of the given TheMealDB ids the user already has saved, in a single query.
+    """
+    return {
+        row.api_recipe_id for row in db.query(models.SavedRecipe.api_recipe_id).filter(
+            models.SavedRecipe.user_id == user_id,
+            models.SavedRecipe.api_recipe_id.in_(api_recipe_ids)
+        ).all()
+    }
+
+def bulk_insert_recipes(db: Session, recipes: List[dict]) -> List[schemas.SavedRecipe]:
+    """
+    Inserts all recipes in one multi-row statement, skipping any that were saved
+    concurrently since we checked. Rows are serialized before the commit expires them.
+    """
+    statement = (
+        insert(models.SavedRecipe)
+        .values(recipes)
+        .on_conflict_do_nothing(index_elements=["user_id", "api_recipe_id"])
+        .returning(models.SavedRecipe)
+    )
+    saved_recipes = [schemas.SavedRecipe.model_validate(recipe) for recipe in db.scalars(statement)]
+    db.commit()
+
+    return saved_recipes
 
 @router.get("/search", response_model=List[schemas.SavedRecipeBase])
 async def search_recipe(query: str, current_user: models.User = Depends(get_current_user)):
@@ -36,25 +104,7 @@ async def search_recipe(query: str, current_user: models.User = Depends(get_curr
     if not meals:
         return []
     
-    results = []
-    for meal in meals:
-        ingredients = []
-        for i in range(1, MAX_INGREDIENTS_PER_MEAL + 1):
-            ingredient_name: str = meal.get(f"strIngredient{i}")
-            ingredient_measure: str = meal.get(f"strMeasure{i}")
-            if ingredient_name and ingredient_name.strip():
-                ingredients.append(schemas.Ingredient(ingredient=ingredient_name, measure=ingredient_measure or ""))
-        
-        recipe_data = schemas.SavedRecipeBase(
-            api_recipe_id=meal['idMeal'],
-            image_url=meal['strMealThumb'],
-            ingredients=ingredients,
-            instructions=meal['strInstructions'],
-            title=meal['strMeal']
-        )
-        results.append(recipe_data)
-    
-    return results
+    return [parse_meal(meal) for meal in meals]
 
 @router.post("/save", response_model=schemas.SavedRecipe, status_code=status.HTTP_201_CREATED)
 def save_recipe(recipe: schemas.SavedRecipeCreate, db: Session=Depends(get_db), current_user: models.User=Depends(get_current_user)):
@@ -83,6 +133,55 @@ def save_recipe(recipe: schemas.SavedRecipeCreate, db: Session=Depends(get_db),
 
     return new_saved_recipe
 
+@router.post("/save/batch", response_model=List[schemas.SavedRecipe], status_code=status.HTTP_201_CREATED)
+async def save_recipes_batch(batch: schemas.SavedRecipeBatchCreate, response: Response, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
+    """
+    Saves several TheMealDB recipes to the logged-in user's collection at once.
+    Recipes the user already has are skipped, as are ids TheMealDB doesn't recognise.
+    Returns only the newly saved recipes, with 201 if anything was saved
+    and 200 with an empty list if there was nothing to save.
+    """
+    # Preserve request order while dropping duplicate ids
+    requested_ids = list(dict.fromkeys(batch.api_recipe_ids))
+
+    already_saved = await run_in_threadpool(get_saved_api_recipe_ids, db, current_user.id, requested_ids)
+    missing_ids = [api_recipe_id for api_recipe_id in requested_ids if api_recipe_id not in already_saved]
+
+    if not missing_ids:
+        response.status_code = status.HTTP_200_OK
+        return []
+
+    # A TaskGroup cancels the remaining lookups as soon as one fails,
+    # so nothing is left running against the client once it's closed.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    try:
+        async with httpx.AsyncClient() as client:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(lookup_meal(client, semaphore, api_recipe_id))
+                    for api_recipe_id in missing_ids
+                ]
+    except* (httpx.HTTPError, ValueError) as exc_group:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Error contacting TheMealDB API: {exc_group.exceptions[0]}"
+        )
+
+    new_recipes = [
+        {**parse_meal(meal).model_dump(), "user_id": current_user.id}
+        for meal in (task.result() for task in tasks)
+        if meal
+    ]
+
+    saved_recipes = []
+    if new_recipes:
+        saved_recipes = await run_in_threadpool(bulk_insert_recipes, db, new_recipes)
+
+    if not saved_recipes:
+        response.status_code = status.HTTP_200_OK
+
+    return saved_recipes
+
 @router.get("/saved", response_model=List[schemas.SavedRecipe])
 def get_saved_recipes(current_user: models.User = Depends(get_current_user)):
     """
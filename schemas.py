@@ -1,7 +1,7 @@
 import datetime
 from uuid import UUID
 import uuid
-from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, constr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, constr
 from typing import Optional, List, Annotated
 
 # -- TheMealDB Item --
@@ -77,6 +77,9 @@ class SavedRecipeBase(BaseModel):
 class SavedRecipeCreate(SavedRecipeBase):
     pass
 
+class SavedRecipeBatchCreate(BaseModel):
+    api_recipe_ids: Annotated[List[str], Field(min_length=1, max_length=50)]
+
 class SavedRecipe(SavedRecipeBase):
     id: int
     user_id: uuid.UUID